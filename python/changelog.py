@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, TypedDict
+
+# Sequenced feed of catalog changes written by the scrape stages.
+#
+# This lives on the private data volume alongside the snapshots it describes,
+# so it is groundwork only: the TypeScript consumers (add_problems.ts,
+# update_ide.ts) run in CI against the root problems.json and can't read it yet.
+#
+# Consumers must apply changes idempotently (every entry carries the full new
+# value). If a stage appends but then fails to save its snapshot, the retry is
+# skipped when the feed still ends with the same changes, but once another
+# stage has appended in between, the changes are recorded again.
+CHANGELOG_PATH = 'data_private/changelog.jsonl'
+
+
+class Change(TypedDict):
+    seq: int
+    time: int
+    kind: str  # "problem" or "mapping"
+    op: str  # "added", "changed" or "removed"
+    id: str
+    value: Any  # new value, None for removals
+
+
+# Bytes read at a time when scanning backwards from the end of the changelog
+TAIL_CHUNK_SIZE = 4096
+
+
+def line_end_before(f, pos: int) -> int:
+    """Return the offset just past the last newline before `pos`, reading backwards."""
+    while pos > 0:
+        step = min(TAIL_CHUNK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        newline = f.read(step).rfind(b'\n')
+        if newline != -1:
+            return pos + newline + 1
+    return 0
+
+
+def last_line_end(f) -> int:
+    """Return the offset just past the last complete line."""
+    return line_end_before(f, f.seek(0, os.SEEK_END))
+
+
+def line_at(f, offset: int) -> bytes:
+    """Return the first line starting at or after `offset`, or b'' at the end of the file."""
+    if offset > 0:
+        # Finish the line containing offset - 1, so we land on a line start
+        f.seek(offset - 1)
+        f.readline()
+    else:
+        f.seek(0)
+    return f.readline()
+
+
+def sequence_of(line: bytes) -> Optional[int]:
+    """Parse a line's sequence number, or None if it was cut short by a crash mid-append."""
+    if not line.endswith(b'\n'):
+        return None
+    return json.loads(line)['seq']
+
+
+def load_changes(since: int = 0) -> List[Change]:
+    """Load all changes with a sequence number greater than `since`.
+
+    Sequence numbers grow with file position, so the first matching entry is
+    found by binary search and only the requested tail of the feed is read.
+    """
+    changes = []
+    try:
+        with open(CHANGELOG_PATH, 'rb') as f:
+            lo, hi = 0, last_line_end(f)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                seq = sequence_of(line_at(f, mid))
+                if seq is None or seq > since:
+                    hi = mid
+                else:
+                    lo = mid + 1
+
+            line = line_at(f, lo)
+            while sequence_of(line) is not None:
+                changes.append(json.loads(line))
+                line = f.readline()
+    except FileNotFoundError:
+        pass
+    return changes
+
+
+def last_sequence() -> int:
+    """Return the sequence number of the most recent change, or 0 if there are none."""
+    try:
+        with open(CHANGELOG_PATH, 'rb') as f:
+            end = last_line_end(f)
+            if end == 0:
+                return 0
+            # The last complete line starts just after the newline before `end`
+            start = line_end_before(f, end - 1)
+            f.seek(start)
+            return sequence_of(f.read(end - start))
+    except FileNotFoundError:
+        return 0
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> List[tuple]:
+    """Compute (op, id, value) entries that turn `old` into `new`."""
+    entries = []
+    for key, value in new.items():
+        if key not in old:
+            entries.append(('added', key, value))
+        elif old[key] != value:
+            entries.append(('changed', key, value))
+    for key in old:
+        if key not in new:
+            entries.append(('removed', key, None))
+
+    # Numeric ids sort numerically so the feed reads in catalog order
+    return sorted(entries, key=lambda e: (int(e[1]) if e[1].isdigit() else float('inf'), e[1]))
+
+
+def drop_partial_line():
+    """Truncate an incomplete last line left by a crash so new entries start on their own line."""
+    try:
+        with open(CHANGELOG_PATH, 'rb+') as f:
+            end = last_line_end(f)
+            if end != f.seek(0, os.SEEK_END):
+                f.truncate(end)
+    except FileNotFoundError:
+        pass
+
+
+def record_changes(kind: str, old: Dict[str, Any], new: Dict[str, Any], dry_run: bool = False) -> int:
+    """Append the differences between two versions of a catalog to the changelog.
+
+    Call this before overwriting the old snapshot, so a failed append can be
+    retried on the next run instead of losing the changes.
+    With `dry_run`, only report what would be recorded.
+    Returns the number of changes recorded.
+    """
+    entries = diff(old, new)
+    if not entries:
+        return 0
+
+    seq = last_sequence()
+    # If the last run appended this exact diff but then failed to save its snapshot,
+    # the feed already has these changes; don't record them again under new numbers
+    tail = load_changes(seq - len(entries))
+    if [(c['kind'], c['op'], c['id'], c['value']) for c in tail] == [(kind, *entry) for entry in entries]:
+        print(f"{len(entries)} {kind} changes already recorded (up to sequence {seq})")
+        return 0
+
+    if dry_run:
+        print(f"Dry run: would record {len(entries)} {kind} changes")
+        return len(entries)
+
+    now = int(time.time())
+    os.makedirs(os.path.dirname(CHANGELOG_PATH), exist_ok=True)
+    drop_partial_line()
+    with open(CHANGELOG_PATH, 'a', encoding='utf-8') as f:
+        for op, key, value in entries:
+            seq += 1
+            change: Change = {
+                'seq': seq,
+                'time': now,
+                'kind': kind,
+                'op': op,
+                'id': key,
+                'value': value,
+            }
+            f.write(json.dumps(change) + '\n')
+        # Make sure the changes are on disk before the caller replaces its snapshot
+        f.flush()
+        os.fsync(f.fileno())
+
+    print(f"Recorded {len(entries)} {kind} changes (up to sequence {seq})")
+    return len(entries)
+
+
+def main():
+    """Print changes since the given sequence number as JSON."""
+    since = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    changes = load_changes(since)
+    json.dump({
+        'since': since,
+        'last': changes[-1]['seq'] if changes else last_sequence(),
+        'changes': changes,
+    }, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
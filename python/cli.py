@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import argparse
+import cProfile
+import importlib
+import os
+import pstats
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Stage name -> (module, description). Modules are only imported when their stage runs.
+STAGES: Dict[str, Tuple[str, str]] = {
+    'usaco': ('usaco_scraper', 'scrape USACO problems into data_private/usaco/problems.json'),
+    'probgate': ('probgate_contests_scraper', 'scrape Probgate contests and download problem files'),
+    'mapping': ('generate_probgate_mapping', 'match Probgate problems to USACO problem IDs'),
+    'judge': ('probgate_judge', 'judge downloaded Probgate problems with their reference solutions'),
+}
+
+# Stages run when none are given, matching the Modal scrape function
+DEFAULT_STAGES = ['usaco', 'probgate', 'mapping']
+
+# Options that only apply to one stage -> that stage
+STAGE_OPTIONS = {
+    'since': 'usaco',
+    'problems': 'judge',
+    'workers': 'judge',
+}
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Run scraper stages locally.',
+        epilog='stages:\n' + '\n'.join(f"  {name:<10}{desc}" for name, (_, desc) in STAGES.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('stages', nargs='*', metavar='stage',
+                        help=f"stages to run in order (default: {' '.join(DEFAULT_STAGES)})")
+    parser.add_argument('--since', type=int,
+                        help='usaco: start scraping at this problem ID instead of after the last known one')
+    parser.add_argument('--problems', action='extend', type=lambda value: [v for v in value.split(',') if v],
+                        metavar='ID[,ID...]',
+                        help='judge: only judge these comma-separated Probgate problem IDs (repeatable)')
+    parser.add_argument('--workers', type=int,
+                        help='judge: number of worker processes (default and maximum: one per CPU)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='run the stages but skip their writes (problems.json, contests.json, problem downloads, '
+                             'the mapping, the changelog and judge reports)')
+    parser.add_argument('--plan', action='store_true',
+                        help='print the stage calls that would be made without importing or running them')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='write a cProfile dump (<stage>.prof) and a text summary (<stage>.txt) per stage to DIR; '
+                             'judge runs solutions in worker processes, so its profile only covers the parent')
+    # Intermixed parsing lets stage names come after options, e.g. "usaco --since 5 judge"
+    args = parser.parse_intermixed_args(argv)
+    for stage in args.stages:
+        if stage not in STAGES:
+            parser.error(f"unknown stage '{stage}' (choose from {', '.join(STAGES)})")
+    if not args.stages:
+        args.stages = DEFAULT_STAGES
+    for option, stage in STAGE_OPTIONS.items():
+        if getattr(args, option) is not None and stage not in args.stages:
+            parser.error(f"--{option} only applies to the '{stage}' stage, which isn't selected")
+    return args
+
+
+def stage_kwargs(stage: str, args: argparse.Namespace) -> dict:
+    """Pick the command line options that apply to a stage's main function."""
+    kwargs = {'dry_run': True} if args.dry_run else {}
+    if stage == 'usaco' and args.since is not None:
+        kwargs['since'] = args.since
+    if stage == 'judge':
+        kwargs.update(problem_ids=args.problems, workers=args.workers)
+    return kwargs
+
+
+def run_stage(stage: str, args: argparse.Namespace):
+    """Import a stage's module and run its main function, optionally under cProfile."""
+    module_name = STAGES[stage][0]
+    kwargs = stage_kwargs(stage, args)
+
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.monotonic()
+    if profiler:
+        profiler.enable()
+    try:
+        module = importlib.import_module(module_name)
+        module.main(**kwargs)
+    finally:
+        if profiler:
+            profiler.disable()
+            write_profile(stage, profiler, args.profile)
+    print(f"Stage '{stage}' finished in {time.monotonic() - start:.1f}s")
+
+
+def write_profile(stage: str, profiler: cProfile.Profile, out_dir: str):
+    """Save the raw profile (viewable with snakeviz or flameprof) and a cumulative-time summary."""
+    os.makedirs(out_dir, exist_ok=True)
+    prof_path = os.path.join(out_dir, f"{stage}.prof")
+    profiler.dump_stats(prof_path)
+    with open(os.path.join(out_dir, f"{stage}.txt"), 'w', encoding='utf-8') as f:
+        stats = pstats.Stats(profiler, stream=f)
+        stats.sort_stats('cumulative').print_stats(50)
+    print(f"Profile for stage '{stage}' saved to '{prof_path}'")
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.plan:
+        for stage in args.stages:
+            module_name = STAGES[stage][0]
+            kwargs = stage_kwargs(stage, args)
+            call_args = ', '.join(f"{k}={v!r}" for k, v in kwargs.items())
+            print(f"Would run stage '{stage}': {module_name}.main({call_args})")
+        return
+
+    for stage in args.stages:
+        print(f"\nRunning stage '{stage}'...")
+        run_stage(stage, args)
+
+
+if __name__ == "__main__":
+    main()
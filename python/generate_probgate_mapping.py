@@ -5,6 +5,8 @@ import re
 import os
 from typing import Dict, List, TypedDict, Optional
 
+import changelog
+
 
 class ProbgateContest(TypedDict):
     contest_id: str
@@ -116,8 +118,8 @@ def find_matching_usaco_problem(
     return None
 
 
-def main():
-    """Generate mapping between USACO and Probgate problems."""
+def main(dry_run: bool = False):
+    """Generate mapping between USACO and Probgate problems. With `dry_run`, nothing is written."""
     # Load USACO problems
     with open("data_private/usaco/problems.json", "r") as f:
         usaco_problems = json.load(f)
@@ -139,10 +141,23 @@ def main():
             else:
                 errors.append(f"Could not find matching USACO problem for Probgate problem: {problem['name']} ({contest['month']}{contest['year']} {contest['division']}, ID: {problem['problem_id']})")
     
+    # Load the previous mapping so changes can be recorded
+    try:
+        with open("data_private/probgate/usaco_to_probgate_mapping.json", "r") as f:
+            old_mapping = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        old_mapping = {}
+
+    # Record changes before saving so a failed append is retried on the next run
+    changelog.record_changes("mapping", old_mapping, mapping, dry_run)
+
     # Save mapping to file
-    os.makedirs("data_private/probgate", exist_ok=True)
-    with open("data_private/probgate/usaco_to_probgate_mapping.json", "w") as f:
-        json.dump(mapping, f, indent=2)
+    if dry_run:
+        print("Dry run: not saving data_private/probgate/usaco_to_probgate_mapping.json")
+    else:
+        os.makedirs("data_private/probgate", exist_ok=True)
+        with open("data_private/probgate/usaco_to_probgate_mapping.json", "w") as f:
+            json.dump(mapping, f, indent=2)
     
     print(f"\nGenerated mapping for {len(mapping)} problems")
     print(f"Found {len(errors)} errors")
@@ -9,11 +9,6 @@ import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-logging.basicConfig(level=logging.WARNING)
-
 # Constants
 REQUEST_DELAY = 0.12  # seconds between requests
 
@@ -220,8 +215,8 @@ def get_problem_zip(session, problem_id):
             shutil.rmtree(tmp_dir)
         return False
 
-def scrape_problems(session, contests):
-    """Download problem ZIP files"""
+def scrape_problems(session, contests, dry_run=False):
+    """Download problem ZIP files (with dry_run, only list the ones that would be downloaded)"""
     for contest in contests.values():
         if 'problems' not in contest:
             continue
@@ -234,6 +229,10 @@ def scrape_problems(session, contests):
             if os.path.exists(problem_dir):
                 print(f"Skipping problem {problem['name']} (ID: {problem_id}) - already downloaded")
                 continue
+
+            if dry_run:
+                print(f"Dry run: would download problem {problem['name']} (ID: {problem_id})")
+                continue
                 
             print(f"Downloading problem {problem['name']} (ID: {problem_id})...")
             get_problem_zip(session, problem_id)
@@ -295,7 +294,7 @@ def login_to_probgate():
         logging.error(f"Error logging in to Probgate: {e}")
         return None
 
-def scrape_probgate():
+def scrape_probgate(dry_run=False):
     # Load existing contests
     existing_contests = load_existing_contests()
     
@@ -358,12 +357,16 @@ def scrape_probgate():
                             }
                             
                             # Save progress after each contest
-                            save_contests(contests)
+                            if not dry_run:
+                                save_contests(contests)
                             
                             # Add a small delay between requests
                             time.sleep(REQUEST_DELAY)
         
-        print(f"\nSuccessfully saved {len(contests)} contests to 'data_private/probgate/contests.json'")
+        if dry_run:
+            print(f"\nDry run: scraped {len(contests)} contests without saving them")
+        else:
+            print(f"\nSuccessfully saved {len(contests)} contests to 'data_private/probgate/contests.json'")
         return session, contests
         
     except requests.RequestException as e:
@@ -371,12 +374,17 @@ def scrape_probgate():
         return None, None
 
 
-def main():
-    session, contests = scrape_probgate()
+def main(dry_run=False):
+    # Load environment variables
+    load_dotenv()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    session, contests = scrape_probgate(dry_run)
     if session and contests:
         # Download problem ZIPs
         print("\nDownloading problem files...")
-        scrape_problems(session, contests)
+        scrape_problems(session, contests, dry_run)
 
 
 if __name__ == "__main__":
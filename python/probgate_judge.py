@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+
+import os
+import errno
+import sys
+import json
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import zip_longest
+from typing import Dict, List, Optional, TypedDict
+
+PROBLEMS_DIR = 'data_private/probgate/problems'
+BUILD_DIR = 'data_private/probgate/judge/build'
+REPORTS_DIR = 'data_private/probgate/judge/reports'
+
+# Per-process limits applied to every reference solution run
+CPU_TIME_LIMIT = 10  # seconds
+MEMORY_LIMIT = 1024 * 1024 * 1024  # bytes (address space, or heap size for Java)
+COMPILE_TIMEOUT = 120  # seconds
+
+# Extensions we know how to build and run, mapped to a language name
+LANGUAGES = {
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.c': 'c',
+    '.py': 'python',
+    '.java': 'java',
+}
+
+# Expected output extensions paired with each input file, in priority order
+ANSWER_EXTENSIONS = ['.out', '.ans', '.a']
+
+# Chunk size for reading output files while comparing
+COMPARE_BUFFER_SIZE = 1 << 16
+
+# A failed run counts as MLE if its sampled peak RSS reaches this fraction of MEMORY_LIMIT...
+MLE_THRESHOLD = 0.9
+# ...or if the end of its stderr contains one of these. Under RLIMIT_AS an allocation
+# usually fails before RSS grows, so the error message is often the only sign.
+OUT_OF_MEMORY_MARKERS = [
+    b'MemoryError',
+    b'std::bad_alloc',
+    b'OutOfMemoryError',
+    b'Cannot allocate memory',
+    b'out of memory',
+]
+STDERR_TAIL_SIZE = 1 << 16
+
+
+class Solution(TypedDict):
+    problem_id: str
+    name: str
+    path: str
+    language: str
+    command: Optional[List[str]]
+    error: Optional[str]
+
+
+class TestCase(TypedDict):
+    name: str
+    input: str
+    answer: str
+
+
+class TestResult(TypedDict):
+    test: str
+    verdict: str
+    cpu_time: float
+    wall_time: float
+    max_rss_kb: int
+    error: Optional[str]
+
+
+def find_test_cases(problem_dir: str) -> List[TestCase]:
+    """Pair every input file in the problem directory or its test directories with its expected output."""
+    tests = []
+    for root, _, files in os.walk(problem_dir):
+        relative = os.path.relpath(root, problem_dir)
+        if relative != '.' and 'test' not in relative.lower():
+            continue
+        names = set(files)
+        for filename in files:
+            stem, ext = os.path.splitext(filename)
+            if ext != '.in':
+                continue
+            for answer_ext in ANSWER_EXTENSIONS:
+                if stem + answer_ext in names:
+                    tests.append({
+                        'name': os.path.relpath(os.path.join(root, stem), problem_dir),
+                        'input': os.path.join(root, filename),
+                        'answer': os.path.join(root, stem + answer_ext),
+                    })
+                    break
+
+    # Sort numerically when test names are numbers (1, 2, ..., 10)
+    def sort_key(test):
+        base = os.path.basename(test['name'])
+        return (os.path.dirname(test['name']), int(base) if base.isdigit() else float('inf'), base)
+
+    return sorted(tests, key=sort_key)
+
+
+def find_solutions(problem_id: str) -> List[Solution]:
+    """Find reference solutions bundled with a problem."""
+    problem_dir = os.path.join(PROBLEMS_DIR, problem_id)
+    solutions = []
+    for root, _, files in os.walk(problem_dir):
+        if 'solution' not in os.path.relpath(root, problem_dir).lower():
+            continue
+        for filename in sorted(files):
+            language = LANGUAGES.get(os.path.splitext(filename)[1].lower())
+            if language is None:
+                continue
+            solutions.append({
+                'problem_id': problem_id,
+                'name': os.path.relpath(os.path.join(root, filename), problem_dir),
+                'path': os.path.join(root, filename),
+                'language': language,
+                'command': None,
+                'error': None,
+            })
+    return solutions
+
+
+def has_grader(problem_id: str) -> bool:
+    """Check whether a problem ships a grader or checker, which plain output comparison can't judge."""
+    problem_dir = os.path.join(PROBLEMS_DIR, problem_id)
+    return any(
+        'grader' in name.lower() or 'checker' in name.lower()
+        for _, dirs, files in os.walk(problem_dir)
+        for name in dirs + files
+    )
+
+
+def compile_solution(solution: Solution) -> Solution:
+    """Build a solution and fill in the command used to run it."""
+    out_dir = os.path.join(BUILD_DIR, solution['problem_id'], solution['name'].replace(os.sep, '_'))
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.abspath(solution['path'])
+    language = solution['language']
+
+    if language == 'python':
+        solution['command'] = [sys.executable, path]
+        return solution
+
+    if language == 'cpp':
+        binary = os.path.join(out_dir, 'sol')
+        build = ['g++', '-O2', '-std=c++17', '-o', binary, path]
+        command = [binary]
+    elif language == 'c':
+        binary = os.path.join(out_dir, 'sol')
+        build = ['gcc', '-O2', '-o', binary, path, '-lm']
+        command = [binary]
+    else:  # java
+        build = ['javac', '-d', out_dir, path]
+        class_name = os.path.splitext(os.path.basename(path))[0]
+        # The JVM reserves far more address space than it uses, so Java runs are
+        # limited by heap size instead of RLIMIT_AS (see limited_command)
+        command = ['java', f"-Xmx{MEMORY_LIMIT // (1024 * 1024)}m", '-Xss256m', '-cp', out_dir, class_name]
+
+    try:
+        result = subprocess.run(build, capture_output=True, text=True, timeout=COMPILE_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        solution['error'] = f"compile failed: {e}"
+        return solution
+    if result.returncode != 0:
+        solution['error'] = f"compile failed: {result.stderr.strip()[:2000]}"
+        return solution
+
+    solution['command'] = command
+    return solution
+
+
+def limited_command(command: List[str], language: str) -> List[str]:
+    """Wrap a command so it runs under the CPU-time and memory limits.
+
+    Limits are applied by prlimit rather than a preexec_fn, which would force
+    subprocess to fork the (large) pool worker instead of spawning directly.
+    """
+    # Resolve the executable here: once prlimit has started, a missing one would look like a crash
+    executable = shutil.which(command[0])
+    if executable is None:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), command[0])
+
+    limits = [f"--cpu={CPU_TIME_LIMIT}:{CPU_TIME_LIMIT + 1}"]
+    if language != 'java':
+        limits.append(f"--as={MEMORY_LIMIT}")
+    return ['prlimit'] + limits + ['--', executable] + command[1:]
+
+
+def read_tokens(f):
+    """Yield whitespace-separated tokens from a binary file without loading it all at once."""
+    leftover = b''
+    while True:
+        chunk = f.read(COMPARE_BUFFER_SIZE)
+        if not chunk:
+            break
+        chunk = leftover + chunk
+        parts = chunk.split()
+        # The last token may continue into the next chunk
+        if parts and not chunk[-1:].isspace():
+            leftover = parts.pop()
+        else:
+            leftover = b''
+        yield from parts
+    if leftover:
+        yield leftover
+
+
+def outputs_match(output, answer_path: str) -> bool:
+    """Compare an output file against the expected answer token by token, ignoring whitespace."""
+    output.seek(0)
+    with open(answer_path, 'rb') as answer:
+        for got, expected in zip_longest(read_tokens(output), read_tokens(answer)):
+            if got != expected:
+                return False
+    return True
+
+
+def read_peak_rss(pid: int) -> int:
+    """Read a running process's peak resident set size in KB, or 0 if it has already exited."""
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def wait_with_usage(process: subprocess.Popen, timeout: float):
+    """Wait for a child process and return its exit status, resource usage and peak RSS.
+
+    ru_maxrss can't be used for memory: Linux carries the parent's high-water mark
+    across exec. VmHWM is reset on exec, so it is sampled while the child runs.
+    """
+    deadline = time.monotonic() + timeout
+    peak_rss = 0
+    timed_out = False
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        peak_rss = max(peak_rss, read_peak_rss(process.pid))
+        if time.monotonic() > deadline:
+            process.kill()
+            _, status, usage = os.wait4(process.pid, 0)
+            timed_out = True
+            break
+        time.sleep(0.005)
+
+    # We reaped the child ourselves, so tell Popen it has exited
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return status, usage, peak_rss, timed_out
+
+
+def ran_out_of_memory(peak_rss: int, stderr) -> bool:
+    """Check whether a failed run was caused by hitting the memory limit."""
+    if peak_rss * 1024 >= MLE_THRESHOLD * MEMORY_LIMIT:
+        return True
+    size = stderr.seek(0, os.SEEK_END)
+    stderr.seek(max(0, size - STDERR_TAIL_SIZE))
+    tail = stderr.read()
+    return any(marker in tail for marker in OUT_OF_MEMORY_MARKERS)
+
+
+def error_result(test: TestCase, error: Exception) -> TestResult:
+    """Result for a test that couldn't be run at all (missing runtime, unreadable files, ...)."""
+    return {
+        'test': test['name'],
+        'verdict': 'error',
+        'cpu_time': 0,
+        'wall_time': 0,
+        'max_rss_kb': 0,
+        'error': f"{type(error).__name__}: {error}",
+    }
+
+
+def run_test(command: List[str], language: str, test: TestCase) -> TestResult:
+    """Run a compiled solution on one test case and return its verdict and resource usage."""
+    start = time.monotonic()
+    try:
+        with open(test['input'], 'rb') as stdin, \
+                tempfile.TemporaryFile() as stdout, \
+                tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                limited_command(command, language),
+                stdin=stdin,
+                stdout=stdout,
+                stderr=stderr,
+            )
+            # Wall-clock cutoff catches solutions that sleep or block instead of using CPU
+            status, usage, peak_rss, timed_out = wait_with_usage(process, CPU_TIME_LIMIT * 3)
+            wall_time = time.monotonic() - start
+            cpu_time = usage.ru_utime + usage.ru_stime
+
+            killed_by = os.WTERMSIG(status) if os.WIFSIGNALED(status) else None
+            if killed_by == signal.SIGXCPU or cpu_time >= CPU_TIME_LIMIT:
+                verdict = 'TLE'
+            elif timed_out:
+                # Killed by the wall clock before using its CPU time: blocked, or starved of CPU
+                verdict = 'WTLE'
+            elif killed_by is not None or os.WEXITSTATUS(status) != 0:
+                verdict = 'MLE' if ran_out_of_memory(peak_rss, stderr) else 'RE'
+            else:
+                verdict = 'AC' if outputs_match(stdout, test['answer']) else 'WA'
+    except (OSError, subprocess.SubprocessError) as e:
+        return error_result(test, e)
+
+    return {
+        'test': test['name'],
+        'verdict': verdict,
+        'cpu_time': round(cpu_time, 3),
+        'wall_time': round(wall_time, 3),
+        'max_rss_kb': peak_rss,
+        'error': None,
+    }
+
+
+def run_solution_test(solution: Solution, test: TestCase) -> TestResult:
+    """Pool entry point: run one (solution, test) pair."""
+    return run_test(solution['command'], solution['language'], test)
+
+
+def build_report(problem_id: str, solutions: List[Solution], results: Dict[str, Dict[int, TestResult]]) -> dict:
+    """Summarize per-solution timings for one problem."""
+    report = {
+        'problem_id': problem_id,
+        'skipped': None,
+        'cpu_time_limit': CPU_TIME_LIMIT,
+        'memory_limit': MEMORY_LIMIT,
+        'solutions': [],
+    }
+    for solution in solutions:
+        by_index = results.get(solution['name'], {})
+        tests = [by_index[i] for i in sorted(by_index)]
+        cpu_times = [r['cpu_time'] for r in tests]
+        report['solutions'].append({
+            'name': solution['name'],
+            'language': solution['language'],
+            'error': solution['error'],
+            'passed': sum(r['verdict'] == 'AC' for r in tests),
+            'total': len(tests),
+            'max_cpu_time': max(cpu_times, default=0),
+            'total_cpu_time': round(sum(cpu_times), 3),
+            'tests': tests,
+        })
+    return report
+
+
+def judge_problems(problem_ids: List[str], workers: Optional[int] = None, dry_run: bool = False) -> Dict[str, dict]:
+    """Judge reference solutions of the given problems against their tests in a process pool.
+
+    Reports are written to REPORTS_DIR unless `dry_run` is set.
+    """
+    # More workers than cores would make solutions compete for CPU and skew timings
+    cpu_count = os.cpu_count() or 1
+    workers = min(workers or cpu_count, cpu_count)
+    tests = {problem_id: find_test_cases(os.path.join(PROBLEMS_DIR, problem_id)) for problem_id in problem_ids}
+    # Problems that can't be judged are reported as skipped, so broken imports stand out
+    skipped: Dict[str, str] = {}
+    solutions: Dict[str, List[Solution]] = {}
+    for problem_id in problem_ids:
+        solutions[problem_id] = []
+        if has_grader(problem_id):
+            skipped[problem_id] = 'grader/checker not supported'
+        elif not tests[problem_id]:
+            skipped[problem_id] = 'no test cases found'
+        else:
+            solutions[problem_id] = find_solutions(problem_id)
+            if not solutions[problem_id]:
+                skipped[problem_id] = 'no reference solutions found'
+    results: Dict[str, Dict[str, Dict[int, TestResult]]] = {problem_id: {} for problem_id in problem_ids}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Build every solution first so the run phase is all test executions
+        compiled = {pool.submit(compile_solution, s): s for sols in solutions.values() for s in sols}
+        for problem_id in problem_ids:
+            solutions[problem_id] = []
+        # Failures are handled per future so one bad solution can't discard the rest of the batch
+        for future in as_completed(compiled):
+            try:
+                solution = future.result()
+            except Exception as e:
+                solution = compiled[future]
+                solution['error'] = f"compile failed: {type(e).__name__}: {e}"
+            solutions[solution['problem_id']].append(solution)
+            if solution['error']:
+                print(f"Problem {solution['problem_id']}: {solution['name']} {solution['error']}")
+
+        runs = {
+            pool.submit(run_solution_test, solution, test): (solution, index, test)
+            for problem_id in problem_ids
+            for solution in solutions[problem_id]
+            if solution['command']
+            for index, test in enumerate(tests[problem_id])
+        }
+        for future in as_completed(runs):
+            solution, index, test = runs[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = error_result(test, e)
+            results[solution['problem_id']].setdefault(solution['name'], {})[index] = result
+
+    if not dry_run:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+    reports = {}
+    for problem_id in problem_ids:
+        solutions[problem_id].sort(key=lambda s: s['name'])
+        report = build_report(problem_id, solutions[problem_id], results[problem_id])
+        report['skipped'] = skipped.get(problem_id)
+        if not dry_run:
+            with open(os.path.join(REPORTS_DIR, f"{problem_id}.json"), 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        reports[problem_id] = report
+    return reports
+
+
+def main(problem_ids: Optional[List[str]] = None, workers: Optional[int] = None, dry_run: bool = False):
+    """Judge downloaded Probgate problems and write a timing report for each one (unless `dry_run`)."""
+    if not problem_ids:
+        if not os.path.isdir(PROBLEMS_DIR):
+            print(f"No problems found in '{PROBLEMS_DIR}'")
+            return
+        problem_ids = sorted(
+            (name for name in os.listdir(PROBLEMS_DIR)
+             if os.path.isdir(os.path.join(PROBLEMS_DIR, name)) and not name.endswith('.tmp')),
+            key=lambda name: int(name) if name.isdigit() else float('inf'),
+        )
+
+    start = time.monotonic()
+    reports = judge_problems(problem_ids, workers, dry_run)
+
+    for problem_id, report in reports.items():
+        if report['skipped']:
+            print(f"Problem {problem_id}: skipped - {report['skipped']}")
+        for solution in report['solutions']:
+            status = solution['error'] or f"{solution['passed']}/{solution['total']} passed"
+            print(f"Problem {problem_id}: {solution['name']} - {status}, max CPU time {solution['max_cpu_time']}s")
+    if dry_run:
+        print(f"\nJudged {len(reports)} problems in {time.monotonic() - start:.1f}s; dry run, no reports saved")
+    else:
+        print(f"\nJudged {len(reports)} problems in {time.monotonic() - start:.1f}s; reports saved to '{REPORTS_DIR}'")
+
+    # Drop build artifacts, only the reports are kept
+    shutil.rmtree(BUILD_DIR, ignore_errors=True)
+    if dry_run:
+        # Leave no trace of the run; the parent only exists to hold the build directory here
+        try:
+            os.rmdir(os.path.dirname(BUILD_DIR))
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -2,9 +2,11 @@ import json
 import re
 import sys
 import os
-from typing import Dict, List, TypedDict
+from typing import Dict, List, Optional, TypedDict
 import requests
 
+import changelog
+
 
 class Sample(TypedDict):
     input: str
@@ -101,17 +103,26 @@ def add_problem(problem_id: int, problems: Dict[str, ProblemData]) -> bool:
         return False
 
 
-def main():
-    """Main function to scrape USACO problems."""
+def main(since: Optional[int] = None, dry_run: bool = False):
+    """
+    Main function to scrape USACO problems.
+    If `since` is given, scraping starts at that problem ID instead of after the last known one.
+    With `dry_run`, problems are scraped but nothing is written.
+    """
     # Load existing problems or create empty dict if file doesn't exist
     try:
         with open('data_private/usaco/problems.json', 'r') as f:
             problems = json.load(f)
+        old_problems = dict(problems)
         LAST_ID = max(int(id_) for id_ in problems.keys())
     except FileNotFoundError:
         problems = {}
+        old_problems = {}
         LAST_ID = 0
 
+    if since is not None:
+        LAST_ID = since - 1
+
     # Maximum gap between consecutive contest IDs
     MAX_GAP = 20
     
@@ -128,6 +139,15 @@ def main():
             consecutive_failures += 1
         current_id += 1
 
+    # Publish what changed so downstream consumers don't have to re-diff everything.
+    # This goes before saving so a failed append is retried on the next run.
+    changelog.record_changes('problem', old_problems, problems, dry_run)
+
+    if dry_run:
+        print("Dry run: not saving data_private/usaco/problems.json")
+        print(f"Last successful ID: {last_added}")
+        return
+
     # Create directory if it doesn't exist
     os.makedirs('data_private/usaco', exist_ok=True)
     